@@ -43,7 +43,7 @@ from typing import Dict, List, Optional, Tuple
 from scripts.rustdoc_utils import (
     RustExample,
     TestResult,
-    compile_single_example,
+    compile_examples,
     format_test_results,
     generate_test_crate,
     get_rust_version,
@@ -670,7 +670,8 @@ def test_examples_individually(
     examples: List[RustExample],
     prelude: str = "",
     run_miri: bool = True,
-    miri_timeout: int = 60
+    miri_timeout: int = 60,
+    jobs: Optional[int] = None
 ) -> List[TestResult]:
     """
     Test each example individually.
@@ -680,6 +681,7 @@ def test_examples_individually(
         prelude: Optional prelude code
         run_miri: Whether to run Miri tests
         miri_timeout: Timeout for Miri execution in seconds
+        jobs: Maximum concurrent compiles (defaults to the CPU count)
         
     Returns:
         List of TestResult objects
@@ -717,13 +719,14 @@ def test_examples_individually(
     
     print(f"\n🧪 Testing {len(examples)} examples...")
     
-    for i, example in enumerate(examples):
-        result = compile_single_example(
-            example, 
-            prelude,
-            current_version=current_version,
-            current_channel=current_channel
-        )
+    compiled = compile_examples(
+        examples,
+        prelude,
+        current_version=current_version,
+        current_channel=current_channel,
+        jobs=jobs
+    )
+    for i, (example, result) in enumerate(zip(examples, compiled)):
         results.append(result)
         
         # Progress indicator
@@ -973,6 +976,12 @@ def main():
         action="store_true",
         help="Exit with error code if any tests fail"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of examples to compile concurrently (default: CPU count)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -1123,7 +1132,8 @@ def main():
                 examples, 
                 prelude, 
                 run_miri=args.run_miri,
-                miri_timeout=config.miri_timeout
+                miri_timeout=config.miri_timeout,
+                jobs=args.jobs
             )
             
             # Print results
@@ -1155,7 +1165,8 @@ def main():
             examples, 
             prelude, 
             run_miri=args.run_miri,
-            miri_timeout=config.miri_timeout
+            miri_timeout=config.miri_timeout,
+            jobs=args.jobs
         )
         
         # Print results
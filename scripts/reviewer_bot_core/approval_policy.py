@@ -16,6 +16,7 @@ Old module no longer preferred for these derivation changes:
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 
 from . import live_review_support
@@ -453,9 +454,8 @@ def compute_pr_approval_state_result(
 
 
 def find_triage_approval_after(bot, reviews: list[dict], since) -> tuple[str, object] | None:
-    permission_cache: dict[str, bool] = {}
-    approvals: list[tuple[object, str, str]] = []
-    for review in reviews:
+    approvals: list[tuple[object, str, int, str]] = []
+    for index, review in enumerate(reviews):
         state = str(review.get("state", "")).upper()
         if state != "APPROVED":
             continue
@@ -467,12 +467,13 @@ def find_triage_approval_after(bot, reviews: list[dict], since) -> tuple[str, ob
             continue
         if since is not None and submitted_at <= since:
             continue
-        approvals.append((submitted_at, str(review.get("id", "")), author))
-    approvals.sort(key=lambda item: (item[0], item[1]))
-    for submitted_at, _, author in approvals:
-        cache_key = author.lower()
-        if cache_key not in permission_cache:
-            permission_cache[cache_key] = live_review_support.permission_status(bot, author, "triage") == "granted"
-        if permission_cache[cache_key]:
+        approvals.append((submitted_at, str(review.get("id", "")), index, author))
+    # Pop approvals oldest first and stop at the first triage approver rather
+    # than sorting the whole history. Permission statuses are memoized per run
+    # by the runtime's GitHub services.
+    heapq.heapify(approvals)
+    while approvals:
+        submitted_at, _, _, author = heapq.heappop(approvals)
+        if live_review_support.permission_status(bot, author, "triage") == "granted":
             return author, submitted_at
     return None
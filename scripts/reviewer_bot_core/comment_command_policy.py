@@ -164,6 +164,23 @@ def authorize_assignment_command(
     )
 
 
+# Ordinary commands that execute with their raw args as-is, mapped to whether
+# they need an assignment request. /away and /feedback validate args first.
+_SIMPLE_ORDINARY_COMMANDS: dict[str, bool] = {
+    OrdinaryCommandId.PASS: True,
+    OrdinaryCommandId.DONE: True,
+    OrdinaryCommandId.LABEL: True,
+    OrdinaryCommandId.SYNC_MEMBERS: False,
+    OrdinaryCommandId.QUEUE: False,
+    OrdinaryCommandId.COMMANDS: False,
+    OrdinaryCommandId.CLAIM: True,
+    OrdinaryCommandId.RELEASE: True,
+    OrdinaryCommandId.RECTIFY: False,
+    OrdinaryCommandId.ASSIGN_SPECIFIC: True,
+    OrdinaryCommandId.ASSIGN_FROM_QUEUE: True,
+}
+
+
 def decide_comment_command(bot, request, classified, *, actor_class: str, commands_help: str) -> CommentCommandDecision:
     if not isinstance(classified, dict):
         return IgnoreDecision()
@@ -188,13 +205,14 @@ def decide_comment_command(bot, request, classified, *, actor_class: str, comman
             success=False,
             react=False,
         )
-    if command == OrdinaryCommandId.PASS.value:
+    needs_assignment_request = _SIMPLE_ORDINARY_COMMANDS.get(command)
+    if needs_assignment_request is not None:
         return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.PASS,
+            command_id=OrdinaryCommandId(command),
             issue_number=issue_number,
             actor=comment_author,
             raw_args=args,
-            needs_assignment_request=True,
+            needs_assignment_request=needs_assignment_request,
         )
     if command == OrdinaryCommandId.AWAY.value:
         if args:
@@ -230,86 +248,6 @@ def decide_comment_command(bot, request, classified, *, actor_class: str, comman
             success=False,
             react=True,
         )
-    if command == OrdinaryCommandId.DONE.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.DONE,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=True,
-        )
-    if command == OrdinaryCommandId.LABEL.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.LABEL,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=True,
-        )
-    if command == OrdinaryCommandId.SYNC_MEMBERS.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.SYNC_MEMBERS,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=False,
-        )
-    if command == OrdinaryCommandId.QUEUE.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.QUEUE,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=False,
-        )
-    if command == OrdinaryCommandId.COMMANDS.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.COMMANDS,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=False,
-        )
-    if command == OrdinaryCommandId.CLAIM.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.CLAIM,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=True,
-        )
-    if command == OrdinaryCommandId.RELEASE.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.RELEASE,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=True,
-        )
-    if command == OrdinaryCommandId.RECTIFY.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.RECTIFY,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=False,
-        )
-    if command == OrdinaryCommandId.ASSIGN_SPECIFIC.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.ASSIGN_SPECIFIC,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=True,
-        )
-    if command == OrdinaryCommandId.ASSIGN_FROM_QUEUE.value:
-        return ExecuteOrdinaryCommandDecision(
-            command_id=OrdinaryCommandId.ASSIGN_FROM_QUEUE,
-            issue_number=issue_number,
-            actor=comment_author,
-            raw_args=args,
-            needs_assignment_request=True,
-        )
     if command == "r?":
         return InlineResponseDecision(
             response=(
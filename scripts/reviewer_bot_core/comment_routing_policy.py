@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from enum import StrEnum
+from functools import lru_cache
 
 from scripts.reviewer_bot_lib.context import PrCommentAdmission
 
@@ -62,12 +63,16 @@ def comment_author_association_allows_trusted_direct(value: str) -> bool:
     return value.strip().upper() in _TRUSTED_PR_COMMENT_AUTHOR_ASSOCIATIONS
 
 
+@lru_cache(maxsize=None)
+def _command_line_pattern(bot_mention: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(bot_mention)}\s+/[A-Za-z0-9?_-]+(?:\s+.*)?$")
+
+
 def comment_line_is_command(bot_mention: str, line: str) -> bool:
     stripped = line.strip()
     if not stripped:
         return False
-    pattern = rf"^{re.escape(bot_mention)}\s+/[A-Za-z0-9?_-]+(?:\s+.*)?$"
-    return re.match(pattern, stripped) is not None
+    return _command_line_pattern(bot_mention).match(stripped) is not None
 
 
 def classify_comment_payload(bot_mention: str, normalized_body: str, parsed_command) -> dict:
@@ -81,8 +86,17 @@ def classify_comment_payload(bot_mention: str, normalized_body: str, parsed_comm
             "normalized_body": normalized_body,
         }
     lines = [line for line in normalized_body.splitlines() if line.strip()]
-    command_lines = [line for line in lines if comment_line_is_command(bot_mention, line)]
-    non_command_lines = [line for line in lines if not comment_line_is_command(bot_mention, line)]
+    command_lines: list[str] = []
+    non_command_lines: list[str] = []
+    if bot_mention in normalized_body:
+        for line in lines:
+            if comment_line_is_command(bot_mention, line):
+                command_lines.append(line)
+            else:
+                non_command_lines.append(line)
+    else:
+        # A command line has to start with the mention, so plain discussion needs no per-line match.
+        non_command_lines = lines
     command = None
     args: list[str] = []
     if parsed_command:
@@ -394,6 +394,7 @@ def has_fail_closed_reviewer_activity_for_current_scope(
     if floor is None:
         _, cycle_boundary = _initial_cycle_boundary(review_data)
         floor = live_review_support.parse_github_timestamp(cycle_boundary)
+    reviewer_key = current_reviewer.lower()
     for gap in fail_closed_gaps:
         if not isinstance(gap, dict):
             continue
@@ -410,7 +411,7 @@ def has_fail_closed_reviewer_activity_for_current_scope(
         if floor is not None and event_timestamp < floor:
             continue
         author = _visible_activity_author(gap)
-        if not isinstance(author, str) or author.lower() != current_reviewer.lower():
+        if not isinstance(author, str) or author.lower() != reviewer_key:
             continue
         if source_kind in {"pull_request_review:submitted", "pull_request_review_comment:created"}:
             if not isinstance(current_head_sha, str) or not current_head_sha.strip():
@@ -83,11 +83,12 @@ def get_valid_current_reviewer_reviews_for_cycle(
     if reviews is None:
         return []
     valid_reviews: list[dict] = []
+    reviewer_key = current_reviewer.lower()
     for review in reviews:
         if not isinstance(review, dict):
             continue
         author = review.get("user", {}).get("login")
-        if not isinstance(author, str) or author.lower() != current_reviewer.lower():
+        if not isinstance(author, str) or author.lower() != reviewer_key:
             continue
         state = str(review.get("state", "")).upper()
         if state not in {"APPROVED", "COMMENTED", "CHANGES_REQUESTED"}:
@@ -105,20 +105,22 @@ def ensure_sidecar_subtree(review_entry: dict[str, Any], *, state_last_updated:
 
     # Codec boundary exception: runtime sidecar mutation belongs to
     # deferred_gap_bookkeeping, but persisted legacy shapes are normalized here.
+    # Subtrees already in canonical position are kept as-is; only legacy
+    # top-level values are copied across.
     sidecars["pending_privileged_commands"] = (
-        deepcopy(sidecars.get("pending_privileged_commands"))
+        sidecars["pending_privileged_commands"]
         if isinstance(sidecars.get("pending_privileged_commands"), dict)
         else deepcopy(review_entry.get("pending_privileged_commands"))
         if isinstance(review_entry.get("pending_privileged_commands"), dict)
         else {}
     )
     sidecars["deferred_gaps"] = (
-        deepcopy(sidecars.get("deferred_gaps"))
+        sidecars["deferred_gaps"]
         if isinstance(sidecars.get("deferred_gaps"), dict)
         else _migrate_deferred_gaps(review_entry.get("deferred_gaps"))
     )
     sidecars["observer_discovery_watermarks"] = (
-        deepcopy(sidecars.get("observer_discovery_watermarks"))
+        sidecars["observer_discovery_watermarks"]
         if isinstance(sidecars.get("observer_discovery_watermarks"), dict)
         else deepcopy(review_entry.get("observer_discovery_watermarks"))
         if isinstance(review_entry.get("observer_discovery_watermarks"), dict)
@@ -380,7 +382,5 @@ def review_entry_to_persisted(review_entry: ReviewEntryState) -> dict[str, Any]:
 
 
 def apply_local_state_core_to_persisted(target: dict[str, Any], review_entry: ReviewEntryState) -> dict[str, Any]:
-    persisted = review_entry_to_persisted(review_entry)
-    for key, value in persisted.items():
-        target[key] = value
+    target.update(review_entry_to_persisted(review_entry))
     return target
@@ -3,7 +3,7 @@
 import hashlib
 import json
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from . import maintenance, reconcile
 from .context import EventContext, ExecutionResult, ManualDispatchRequest
@@ -204,27 +204,33 @@ def build_event_context(bot: AppEventContextRuntime) -> EventContext:
     return decode_event_context(bot)
 
 
+# Issue and pull request events whose handler only needs the loaded state. Every
+# listed event mutates state; other actions on these events are read-only.
+_STATE_EVENT_HANDLERS: dict[tuple[str, str], str] = {
+    ("issues", "opened"): "handle_issue_or_pr_opened",
+    ("issues", "assigned"): "handle_assigned_event",
+    ("issues", "unassigned"): "handle_unassigned_event",
+    ("issues", "labeled"): "handle_labeled_event",
+    ("issues", "unlabeled"): "handle_unlabeled_event",
+    ("issues", "edited"): "handle_issue_edited_event",
+    ("issues", "reopened"): "handle_reopened_event",
+    ("issues", "closed"): "handle_closed_event",
+    ("pull_request_target", "opened"): "handle_issue_or_pr_opened",
+    ("pull_request_target", "labeled"): "handle_labeled_event",
+    ("pull_request_target", "unlabeled"): "handle_unlabeled_event",
+    ("pull_request_target", "reopened"): "handle_reopened_event",
+    ("pull_request_target", "closed"): "handle_closed_event",
+    ("pull_request_target", "synchronize"): "handle_pull_request_target_synchronize",
+}
+
+
 def _classify_event_intent_from_context(bot: AppEventContextRuntime, context: EventContext) -> str:
     event_name = context.event_name
     event_action = context.event_action
 
-    if event_name == "issues":
-        if event_action in {
-            "opened",
-            "edited",
-            "labeled",
-            "unlabeled",
-            "assigned",
-            "unassigned",
-            "reopened",
-            "closed",
-        }:
-            return bot.EVENT_INTENT_MUTATING
-        return bot.EVENT_INTENT_NON_MUTATING_READONLY
-
-    if event_name == "pull_request_target":
-        if event_action in {"opened", "labeled", "unlabeled", "reopened", "closed", "synchronize"}:
-            return bot.EVENT_INTENT_MUTATING
+    if (event_name, event_action) in _STATE_EVENT_HANDLERS:
+        return bot.EVENT_INTENT_MUTATING
+    if event_name in {"issues", "pull_request_target"}:
         return bot.EVENT_INTENT_NON_MUTATING_READONLY
 
     if event_name == "issue_comment":
@@ -267,27 +273,7 @@ def _classify_event_intent_from_context(bot: AppEventContextRuntime, context: Ev
 
 def classify_event_intent(bot: AppEventContextRuntime, event_name: str, event_action: str) -> str:
     """Classify whether a run can mutate reviewer-bot state."""
-    context = build_event_context(bot)
-    context = EventContext(
-        event_name=event_name,
-        event_action=event_action,
-        issue_number=context.issue_number,
-        is_pull_request=context.is_pull_request,
-        issue_author=context.issue_author,
-        issue_state=context.issue_state,
-        issue_labels=context.issue_labels,
-        comment_id=context.comment_id,
-        comment_author=context.comment_author,
-        comment_body=context.comment_body,
-        comment_source_event_key=context.comment_source_event_key,
-        pr_is_cross_repository=context.pr_is_cross_repository,
-        review_author=context.review_author,
-        review_state=context.review_state,
-        workflow_kind=context.workflow_kind,
-        workflow_run_triggering_conclusion=context.workflow_run_triggering_conclusion,
-        workflow_artifact_contract=context.workflow_artifact_contract,
-        manual_action=context.manual_action,
-    )
+    context = replace(build_event_context(bot), event_name=event_name, event_action=event_action)
     return _classify_event_intent_from_context(bot, context)
 
 
@@ -376,38 +362,9 @@ def execute_run(bot: AppExecutionRuntime, context: EventContext) -> ExecutionRes
             if sync_changes:
                 _log(bot, "info", f"Members sync changes: {sync_changes}", sync_changes=sync_changes)
 
-        if event_name == "issues":
-            if event_action == "opened":
-                state_changed = bot.handlers.handle_issue_or_pr_opened(state)
-            elif event_action == "assigned":
-                state_changed = bot.handlers.handle_assigned_event(state)
-            elif event_action == "unassigned":
-                state_changed = bot.handlers.handle_unassigned_event(state)
-            elif event_action == "labeled":
-                state_changed = bot.handlers.handle_labeled_event(state)
-            elif event_action == "unlabeled":
-                state_changed = bot.handlers.handle_unlabeled_event(state)
-            elif event_action == "edited":
-                state_changed = bot.handlers.handle_issue_edited_event(state)
-            elif event_action == "reopened":
-                state_changed = bot.handlers.handle_reopened_event(state)
-            elif event_action == "closed":
-                state_changed = bot.handlers.handle_closed_event(state)
-
-        elif event_name == "pull_request_target":
-            if event_action == "opened":
-                state_changed = bot.handlers.handle_issue_or_pr_opened(state)
-            elif event_action == "labeled":
-                state_changed = bot.handlers.handle_labeled_event(state)
-            elif event_action == "unlabeled":
-                state_changed = bot.handlers.handle_unlabeled_event(state)
-            elif event_action == "reopened":
-                state_changed = bot.handlers.handle_reopened_event(state)
-            elif event_action == "closed":
-                state_changed = bot.handlers.handle_closed_event(state)
-            elif event_action == "synchronize":
-                state_changed = bot.handlers.handle_pull_request_target_synchronize(state)
-
+        handler_name = _STATE_EVENT_HANDLERS.get((event_name, event_action))
+        if handler_name is not None:
+            state_changed = getattr(bot.handlers, handler_name)(state)
         elif event_name == "issue_comment":
             if event_action == "created":
                 if event_intent == bot.EVENT_INTENT_NON_MUTATING_DEFER:
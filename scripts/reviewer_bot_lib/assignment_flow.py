@@ -622,6 +622,12 @@ def _remove_live_assignee(bot, request, issue_number: int, username: str):
     return _coerce_attempt(bot, bot.github.remove_issue_assignee(issue_number, username), success_status=204)
 
 
+def _remove_live_assignees(bot, request, issue_number: int, usernames: list[str]):
+    if request.is_pull_request:
+        return _coerce_attempt(bot, bot.github.remove_pr_reviewers(issue_number, usernames), success_status=204)
+    return _coerce_attempt(bot, bot.github.remove_issue_assignees(issue_number, usernames), success_status=204)
+
+
 def _add_live_assignee(bot, request, issue_number: int, username: str):
     if request.is_pull_request:
         return _coerce_attempt(bot, bot.github.request_pr_reviewer_assignment(issue_number, username), success_status=201)
@@ -661,7 +667,8 @@ def confirm_reviewer_assignment(
             "reason": "assignees_unavailable",
             "diagnostic_changed": diagnostic_changed,
         }
-    if request.issue_author and reviewer.lower() == request.issue_author.lower():
+    reviewer_key = reviewer.lower()
+    if request.issue_author and reviewer_key == request.issue_author.lower():
         if isinstance(review_data, dict):
             diagnostic_changed = _store_assignment_marker(
                 bot,
@@ -680,10 +687,11 @@ def confirm_reviewer_assignment(
             "current_assignees": live_before,
             "diagnostic_changed": diagnostic_changed,
         }
+    live_before_normalized = _normalize_logins(live_before)
     if (
         isinstance(stored_reviewer, str)
-        and stored_reviewer.lower() == reviewer.lower()
-        and _normalize_logins(live_before) == [reviewer.lower()]
+        and stored_reviewer.lower() == reviewer_key
+        and live_before_normalized == [reviewer_key]
     ):
         return {
             "confirmed": True,
@@ -705,12 +713,10 @@ def confirm_reviewer_assignment(
             "diagnostic_changed": diagnostic_changed,
         }
     removal_attempts = {}
-    live_before_normalized = _normalize_logins(live_before)
-    for assignee in live_before:
-        if assignee.lower() == reviewer.lower():
-            continue
-        attempt = _remove_live_assignee(bot, request, issue_number, assignee)
-        removal_attempts[assignee] = attempt
+    stale_assignees = [assignee for assignee in live_before if assignee.lower() != reviewer_key]
+    if stale_assignees:
+        attempt = _remove_live_assignees(bot, request, issue_number, stale_assignees)
+        removal_attempts = dict.fromkeys(stale_assignees, attempt)
         if not attempt.success:
             if isinstance(review_data, dict):
                 diagnostic_changed = _store_assignment_marker(
@@ -736,7 +742,7 @@ def confirm_reviewer_assignment(
                 "diagnostic_changed": diagnostic_changed,
             }
     assignment_attempt = None
-    if reviewer.lower() not in live_before_normalized:
+    if reviewer_key not in live_before_normalized:
         assignment_attempt = _add_live_assignee(bot, request, issue_number, reviewer)
         if not assignment_attempt.success and isinstance(review_data, dict):
             diagnostic_changed = _store_assignment_marker(
@@ -878,7 +884,8 @@ def confirm_reviewer_release(
             "diagnostic_changed": diagnostic_changed,
         }
     removal_attempt = None
-    if reviewer.lower() in _normalize_logins(live_before):
+    reviewer_key = reviewer.lower()
+    if any(isinstance(value, str) and value.lower() == reviewer_key for value in live_before):
         removal_attempt = _remove_live_assignee(bot, request, issue_number, reviewer)
         if not removal_attempt.success:
             if isinstance(review_data, dict):
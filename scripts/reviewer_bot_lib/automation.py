@@ -1,6 +1,7 @@
 """Automation-heavy reviewer-bot helpers."""
 
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -156,6 +157,7 @@ def _resolve_accept_no_fls_changes_plan(
     audit_result: subprocess.CompletedProcess,
     update_result: subprocess.CompletedProcess,
     changed_files_after: list[str],
+    default_branch: Future[str],
  ) -> privileged_command_policy.CompletePrivilegedExecution | privileged_command_policy.AcceptNoFlsChangesPlan:
     post_update = privileged_command_policy.assess_accept_no_fls_changes_post_update(
         audit_returncode=audit_result.returncode,
@@ -166,7 +168,7 @@ def _resolve_accept_no_fls_changes_plan(
     )
     if post_update is not None:
         return post_update
-    base_branch = bot.adapters.automation.get_default_branch()
+    base_branch = default_branch.result()
     branch_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     provisional = privileged_command_policy.plan_accept_no_fls_changes_execution(
         issue_number=issue_number,
@@ -202,6 +204,49 @@ def _resolve_accept_no_fls_changes_plan(
     )
 
 
+def _run_accept_no_fls_changes_tools(
+    bot,
+    repo_root: Path,
+) -> privileged_command_policy.CompletePrivilegedExecution | tuple[subprocess.CompletedProcess, subprocess.CompletedProcess]:
+    audit_result = bot.adapters.automation.run_command(
+        ["uv", "run", "--locked", "python", "scripts/fls_audit.py", "--summary-only", "--fail-on-impact"],
+        cwd=repo_root,
+        check=False,
+    )
+    if audit_result.returncode == 2:
+        return privileged_command_policy.CompletePrivilegedExecution(
+            status="failed_closed",
+            result_code="audit_reported_guideline_impact",
+            result_message=(
+                "❌ The audit reports affected guidelines. Please review and open a PR with "
+                "the necessary guideline updates instead."
+            ),
+        )
+    if audit_result.returncode != 0:
+        details = bot.adapters.automation.summarize_output(audit_result)
+        detail_text = f"\n\nDetails:\n```\n{details}\n```" if details else ""
+        return privileged_command_policy.CompletePrivilegedExecution(
+            status="failed_closed",
+            result_code="audit_failed",
+            result_message=f"❌ Audit command failed.{detail_text}",
+        )
+
+    update_result = bot.adapters.automation.run_command(
+        ["uv", "run", "--locked", "python", "./make.py", "--update-spec-lock-file"],
+        cwd=repo_root,
+        check=False,
+    )
+    if update_result.returncode != 0:
+        details = bot.adapters.automation.summarize_output(update_result)
+        detail_text = f"\n\nDetails:\n```\n{details}\n```" if details else ""
+        return privileged_command_policy.CompletePrivilegedExecution(
+            status="failed_closed",
+            result_code="update_failed",
+            result_message=f"❌ Failed to update spec.lock.{detail_text}",
+        )
+    return audit_result, update_result
+
+
 def handle_accept_no_fls_changes_command(
     bot,
     issue_number: int,
@@ -243,42 +288,14 @@ def handle_accept_no_fls_changes_command(
         )
     repo_root = Path(execution_plan.execution_context.target_repo_root)
 
-    audit_result = bot.adapters.automation.run_command(
-        ["uv", "run", "--locked", "python", "scripts/fls_audit.py", "--summary-only", "--fail-on-impact"],
-        cwd=repo_root,
-        check=False,
-    )
-    if audit_result.returncode == 2:
-        return privileged_command_policy.CompletePrivilegedExecution(
-            status="failed_closed",
-            result_code="audit_reported_guideline_impact",
-            result_message=(
-                "❌ The audit reports affected guidelines. Please review and open a PR with "
-                "the necessary guideline updates instead."
-            ),
-        )
-    if audit_result.returncode != 0:
-        details = bot.adapters.automation.summarize_output(audit_result)
-        detail_text = f"\n\nDetails:\n```\n{details}\n```" if details else ""
-        return privileged_command_policy.CompletePrivilegedExecution(
-            status="failed_closed",
-            result_code="audit_failed",
-            result_message=f"❌ Audit command failed.{detail_text}",
-        )
-
-    update_result = bot.adapters.automation.run_command(
-        ["uv", "run", "--locked", "python", "./make.py", "--update-spec-lock-file"],
-        cwd=repo_root,
-        check=False,
-    )
-    if update_result.returncode != 0:
-        details = bot.adapters.automation.summarize_output(update_result)
-        detail_text = f"\n\nDetails:\n```\n{details}\n```" if details else ""
-        return privileged_command_policy.CompletePrivilegedExecution(
-            status="failed_closed",
-            result_code="update_failed",
-            result_message=f"❌ Failed to update spec.lock.{detail_text}",
-        )
+    # The default-branch lookup does not depend on the audit or the spec.lock
+    # update, so overlap its GitHub round-trip with those subprocesses.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        default_branch = executor.submit(bot.adapters.automation.get_default_branch)
+        tool_results = _run_accept_no_fls_changes_tools(bot, repo_root)
+    if isinstance(tool_results, privileged_command_policy.CompletePrivilegedExecution):
+        return tool_results
+    audit_result, update_result = tool_results
 
     changed_files_after = bot.adapters.automation.list_changed_files(repo_root)
     planning = _resolve_accept_no_fls_changes_plan(
@@ -288,6 +305,7 @@ def handle_accept_no_fls_changes_command(
         audit_result=audit_result,
         update_result=update_result,
         changed_files_after=changed_files_after,
+        default_branch=default_branch,
     )
     if not isinstance(planning, privileged_command_policy.AcceptNoFlsChangesPlan):
         return planning
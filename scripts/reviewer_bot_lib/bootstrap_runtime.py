@@ -46,6 +46,9 @@ class _BootstrapStateStoreServices:
 class _BootstrapGitHubServices:
     def __init__(self, runtime_getter):
         self._runtime_getter = runtime_getter
+        self._repo_labels: frozenset[str] | None = None
+        self._permission_statuses: dict[tuple[str, str], str] = {}
+        self._ensured_labels: set[str] = set()
 
     def github_api_request(self, *args, **kwargs):
         return github_api.github_api_request(self._runtime_getter(), *args, **kwargs)
@@ -72,7 +75,10 @@ class _BootstrapGitHubServices:
         return github_api.post_comment_result(self._runtime_getter(), issue_number, body)
 
     def get_repo_labels(self):
-        return github_api.get_repo_labels(self._runtime_getter())
+        # Repository labels do not change within a run; failed (empty) reads are retried.
+        if not self._repo_labels:
+            self._repo_labels = github_api.get_repo_labels(self._runtime_getter())
+        return self._repo_labels
 
     def add_label(self, issue_number, label):
         return github_api.add_label(self._runtime_getter(), issue_number, label)
@@ -81,7 +87,13 @@ class _BootstrapGitHubServices:
         return github_api.remove_label(self._runtime_getter(), issue_number, label)
 
     def ensure_label_exists(self, label, *, color=None, description=None):
-        return github_api.ensure_label_exists(self._runtime_getter(), label, color=color, description=description)
+        # A label that exists (or was just created) stays so for the rest of the run.
+        if label in self._ensured_labels:
+            return True
+        ensured = github_api.ensure_label_exists(self._runtime_getter(), label, color=color, description=description)
+        if ensured:
+            self._ensured_labels.add(label)
+        return ensured
 
     def get_issue_assignees(self, issue_number, *, is_pull_request=None):
         return github_api.get_issue_assignees(
@@ -109,14 +121,30 @@ class _BootstrapGitHubServices:
     def remove_issue_assignee(self, issue_number, username):
         return github_api.remove_issue_assignee(self._runtime_getter(), issue_number, username)
 
+    def remove_issue_assignees(self, issue_number, usernames):
+        return github_api.remove_issue_assignees(self._runtime_getter(), issue_number, usernames)
+
     def remove_pr_reviewer(self, issue_number, username):
         return github_api.remove_pr_reviewer(self._runtime_getter(), issue_number, username)
 
+    def remove_pr_reviewers(self, issue_number, usernames):
+        return github_api.remove_pr_reviewers(self._runtime_getter(), issue_number, usernames)
+
     def get_user_permission_status(self, username, required_permission="triage"):
-        return github_api.get_user_permission_status(self._runtime_getter(), username, required_permission)
+        # Collaborator permissions are stable within a run; "unavailable" reads are retried.
+        key = (username.lower(), required_permission)
+        status = self._permission_statuses.get(key)
+        if status is None:
+            status = github_api.get_user_permission_status(self._runtime_getter(), username, required_permission)
+            if status != "unavailable":
+                self._permission_statuses[key] = status
+        return status
 
     def check_user_permission(self, username, required_permission="triage"):
-        return github_api.check_user_permission(self._runtime_getter(), username, required_permission)
+        status = self.get_user_permission_status(username, required_permission)
+        if status == "unavailable":
+            return None
+        return status == "granted"
 
     def get_issue_or_pr_snapshot(self, issue_number):
         return github_api.get_issue_or_pr_snapshot(self._runtime_getter(), issue_number)
@@ -329,6 +357,7 @@ class _BootstrapWorkflowAdapterServices:
 class _BootstrapAutomationAdapterServices:
     def __init__(self, runtime_getter):
         self._runtime_getter = runtime_getter
+        self._default_branch: str | None = None
 
     def _runtime(self):
         return self._runtime_getter()
@@ -343,7 +372,9 @@ class _BootstrapAutomationAdapterServices:
         return automation.list_changed_files(repo_root)
 
     def get_default_branch(self):
-        return automation.get_default_branch(self._runtime())
+        if self._default_branch is None:
+            self._default_branch = automation.get_default_branch(self._runtime())
+        return self._default_branch
 
     def find_open_pr_for_branch_status(self, branch):
         return automation.find_open_pr_for_branch_status(self._runtime(), branch)
@@ -2,6 +2,8 @@
 
 import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
 from scripts.reviewer_bot_core import comment_command_policy
 
@@ -9,6 +11,7 @@ from . import assignment_flow, review_state
 from .config import CODING_GUIDELINE_LABEL
 from .context import AssignmentRequest
 from .event_inputs import build_assignment_request as decode_assignment_request
+from .queue import find_member_indices, login_key
 
 
 def _log(bot, level: str, message: str, **fields) -> None:
@@ -40,34 +43,45 @@ def build_assignment_request(bot, *, issue_number: int) -> AssignmentRequest:
     return decode_assignment_request(bot, issue_number=issue_number)
 
 
+_FENCED_BLOCK_PATTERNS = tuple(
+    (fence, re.compile(re.escape(fence) + r".*?" + re.escape(fence), re.DOTALL))
+    for fence in ("```", "~~~")
+)
+_INDENTED_CODE_PATTERN = re.compile(r"^(?: {4}|\t).*$", re.MULTILINE)
+_INLINE_CODE_PATTERN = re.compile(r"`[^`]*`")
+
+
+@lru_cache(maxsize=None)
+def _mention_patterns(bot_mention: str) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    mention = re.escape(bot_mention)
+    flags = re.IGNORECASE | re.MULTILINE
+    return re.compile(rf"{mention}\s+/(\S+)", flags), re.compile(rf"{mention}\s+(\S+)", flags)
+
+
 def strip_code_blocks(comment_body: str) -> str:
     sanitized = comment_body
-
-    def strip_fenced_blocks(text: str, fence: str) -> str:
-        pattern = re.compile(re.escape(fence) + r".*?" + re.escape(fence), re.DOTALL)
-        stripped = pattern.sub("", text)
-        last_fence = stripped.rfind(fence)
+    for fence, pattern in _FENCED_BLOCK_PATTERNS:
+        sanitized = pattern.sub("", sanitized)
+        last_fence = sanitized.rfind(fence)
         if last_fence != -1:
-            stripped = stripped[:last_fence]
-        return stripped
-
-    sanitized = strip_fenced_blocks(sanitized, "```")
-    sanitized = strip_fenced_blocks(sanitized, "~~~")
-    sanitized = re.sub(r"^(?: {4}|\t).*$", "", sanitized, flags=re.MULTILINE)
-    sanitized = re.sub(r"`[^`]*`", "", sanitized)
+            sanitized = sanitized[:last_fence]
+    sanitized = _INDENTED_CODE_PATTERN.sub("", sanitized)
+    sanitized = _INLINE_CODE_PATTERN.sub("", sanitized)
     return sanitized
 
 
 def parse_command(bot, comment_body: str) -> tuple[str, list[str]] | None:
-    mention_pattern = rf"{re.escape(bot.BOT_MENTION)}\s+/\S+"
-    pattern = rf"{re.escape(bot.BOT_MENTION)}\s+/(\S+)(.*)$"
-    matches = re.findall(mention_pattern, comment_body, re.IGNORECASE | re.MULTILINE)
+    # Most comments never mention the bot; skip both regex scans for them.
+    if bot.BOT_MENTION.lower() not in comment_body.lower():
+        return None
+    command_pattern, malformed_pattern = _mention_patterns(bot.BOT_MENTION)
+    # Two matches are enough to reject the comment, so stop scanning there.
+    matches = list(islice(command_pattern.finditer(comment_body), 2))
     if len(matches) > 1:
         return "_multiple_commands", []
-    match = re.search(pattern, comment_body, re.IGNORECASE | re.MULTILINE)
+    match = matches[0] if matches else None
     if not match:
-        malformed_pattern = rf"{re.escape(bot.BOT_MENTION)}\s+(\S+)"
-        malformed_match = re.search(malformed_pattern, comment_body, re.IGNORECASE | re.MULTILINE)
+        malformed_match = malformed_pattern.search(comment_body)
         if malformed_match:
             attempted = malformed_match.group(1).lower()
             if attempted in _CONVERSATIONAL_WORDS:
@@ -77,7 +91,8 @@ def parse_command(bot, comment_body: str) -> tuple[str, list[str]] | None:
             return "_malformed_unknown", [attempted]
         return None
     command = match.group(1).lower()
-    args_str = match.group(2).strip()
+    line_end = comment_body.find("\n", match.end())
+    args_str = comment_body[match.end() : line_end if line_end != -1 else len(comment_body)].strip()
     if command == "r?":
         target = args_str.split()[0] if args_str else ""
         if target.lower() == "producers":
@@ -191,6 +206,10 @@ def _assignment_failure_response(target_reviewer: str, result: dict[str, object]
     return f"{prefix}❌ GitHub could not confirm @{target_reviewer} as reviewer."
 
 
+def _previous_assignees_text(current_assignees: list[str]) -> str:
+    return f" (previously: @{', @'.join(current_assignees)})" if current_assignees else ""
+
+
 def _single_current_assignee_or_error(current_assignees: list[str]) -> tuple[str | None, str | None]:
     if not current_assignees:
         return None, "❌ No reviewer is currently assigned to pass."
@@ -213,13 +232,16 @@ def handle_pass_command(
     reviewer_authority: dict[str, object] | None = None,
 ) -> tuple[str, bool]:
     assignment_request = request or build_assignment_request(bot, issue_number=issue_number)
-    authority = reviewer_authority or assignment_flow.resolve_reviewer_command_authority(
-        bot,
-        state,
-        assignment_request,
-        actor=comment_author,
-    )
-    authority = assignment_flow.require_reviewer_command_actor(authority, comment_author)
+    if reviewer_authority:
+        authority = assignment_flow.require_reviewer_command_actor(reviewer_authority, comment_author)
+    else:
+        # Resolving with ``actor`` already applies the current-reviewer check.
+        authority = assignment_flow.resolve_reviewer_command_authority(
+            bot,
+            state,
+            assignment_request,
+            actor=comment_author,
+        )
     if not authority.get("authorized"):
         return _reviewer_command_authority_error("pass", authority), False
     issue_data = authority.get("review_data")
@@ -276,20 +298,15 @@ def handle_pass_until_command(
     normalized_return_date = parsed_date.isoformat()
     if parsed_date <= bot.clock.now().date():
         return "❌ Return date must be in the future.", False
-    user_in_queue = None
-    user_index = None
-    for index, member in enumerate(state["queue"]):
-        if member["github"].lower() == comment_author.lower():
-            user_in_queue = member
-            user_index = index
-            break
+    user_index, away_index = find_member_indices(state, comment_author)
+    user_in_queue = state["queue"][user_index] if user_index is not None else None
     if not user_in_queue:
-        for entry in state.get("pass_until", []):
-            if entry["github"].lower() == comment_author.lower():
-                entry["return_date"] = normalized_return_date
-                if reason:
-                    entry["reason"] = reason
-                return (f"✅ Updated your return date to {normalized_return_date}.\n\nYou're already marked as away."), True
+        if away_index is not None:
+            entry = state["pass_until"][away_index]
+            entry["return_date"] = normalized_return_date
+            if reason:
+                entry["reason"] = reason
+            return (f"✅ Updated your return date to {normalized_return_date}.\n\nYou're already marked as away."), True
         return (f"❌ @{comment_author} is not in the reviewer queue. Only Producers can use this command."), False
     pass_entry = {"github": user_in_queue["github"], "name": user_in_queue.get("name", user_in_queue["github"]), "return_date": normalized_return_date, "original_queue_position": user_index}
     if reason:
@@ -298,7 +315,7 @@ def handle_pass_until_command(
     if assignee_error:
         return assignee_error, False
     live_reviewer, reviewer_error = _single_current_assignee_or_error(current_assignees)
-    is_current_reviewer = reviewer_error is None and isinstance(live_reviewer, str) and live_reviewer.lower() == comment_author.lower()
+    is_current_reviewer = reviewer_error is None and isinstance(live_reviewer, str) and login_key(live_reviewer) == login_key(comment_author)
     reassigned_msg = ""
     if is_current_reviewer:
         skip_set = {assignment_request.issue_author} if assignment_request.issue_author else set()
@@ -367,7 +384,7 @@ def handle_done_command(
     current_assignees, assignee_error = _current_assignees_or_error(bot, issue_number)
     if assignee_error:
         return assignee_error, False
-    is_current_reviewer = len(current_assignees) == 1 and current_assignees[0].lower() == comment_author.lower()
+    is_current_reviewer = len(current_assignees) == 1 and login_key(current_assignees[0]) == login_key(comment_author)
     if not is_current_reviewer:
         permission_status = bot.github.get_user_permission_status(comment_author, "triage")
         if permission_status == "unavailable":
@@ -481,8 +498,9 @@ def handle_claim_command(
     request: AssignmentRequest | None = None,
 ) -> tuple[str, bool]:
     assignment_request = request or build_assignment_request(bot, issue_number=issue_number)
-    is_producer = any(member["github"].lower() == comment_author.lower() for member in state["queue"])
-    is_away = any(member["github"].lower() == comment_author.lower() for member in state.get("pass_until", []))
+    queue_index, away_index = find_member_indices(state, comment_author)
+    is_producer = queue_index is not None
+    is_away = away_index is not None
     if not is_producer and not is_away:
         return (f"❌ @{comment_author} is not in the reviewer queue. Only Producers can claim reviews."), False
     if is_away:
@@ -498,7 +516,7 @@ def handle_claim_command(
         "claim",
         current_assignees=current_assignees,
     )
-    prev_text = f" (previously: @{', @'.join(current_assignees)})" if current_assignees else ""
+    prev_text = _previous_assignees_text(current_assignees)
     if not result.get("confirmed"):
         return _assignment_failure_response(comment_author, result, prefix=""), False, bool(
             result.get("diagnostic_changed") or result.get("cleared_current_reviewer")
@@ -525,23 +543,22 @@ def handle_release_command(
     else:
         target_username = comment_author
         reason = " ".join(args) if args else None
-    issue_key = str(issue_number)
-    assignment_method = None
-    if "active_reviews" in state and issue_key in state["active_reviews"]:
-        issue_data = state["active_reviews"][issue_key]
-        if isinstance(issue_data, dict):
-            assignment_method = issue_data.get("assignment_method")
-    authority = reviewer_authority or assignment_flow.resolve_reviewer_command_authority(
-        bot,
-        state,
-        request,
-        actor=comment_author,
-    )
-    authority = assignment_flow.require_reviewer_command_actor(authority, comment_author)
+    issue_data = state.get("active_reviews", {}).get(str(issue_number))
+    assignment_method = issue_data.get("assignment_method") if isinstance(issue_data, dict) else None
+    if reviewer_authority:
+        authority = assignment_flow.require_reviewer_command_actor(reviewer_authority, comment_author)
+    else:
+        authority = assignment_flow.resolve_reviewer_command_authority(
+            bot,
+            state,
+            request,
+            actor=comment_author,
+        )
     if not authority.get("authorized"):
         return _reviewer_command_authority_error("release", authority), False
     tracked_reviewer = str(authority["tracked_reviewer"])
-    if target_username.lower() != tracked_reviewer.lower():
+    # The authority check already matched the actor to the tracked reviewer.
+    if target_username != comment_author and login_key(target_username) != login_key(tracked_reviewer):
         return (f"❌ @{target_username} is not the current reviewer. Current reviewer: @{tracked_reviewer}"), False
     result = assignment_flow.confirm_reviewer_release(
         bot,
@@ -581,15 +598,13 @@ def handle_assign_command(
     )
     if not authorization.authorized:
         return _assignment_authorization_failure("r?", authorization), False
-    is_producer = any(member["github"].lower() == username.lower() for member in state["queue"])
-    is_away = any(member["github"].lower() == username.lower() for member in state.get("pass_until", []))
-    if not is_producer and not is_away:
+    queue_index, away_index = find_member_indices(state, username)
+    is_producer = queue_index is not None
+    if not is_producer and away_index is None:
         return (f"⚠️ @{username} is not in the reviewer queue (not a Producer). Assigning anyway, but they may not have review permissions."), False
-    if is_away:
-        for entry in state.get("pass_until", []):
-            if entry["github"].lower() == username.lower():
-                return_date = entry.get("return_date", "unknown")
-                return (f"⚠️ @{username} is currently marked as away until {return_date}. Consider assigning someone else or waiting."), False
+    if away_index is not None:
+        return_date = state["pass_until"][away_index].get("return_date", "unknown")
+        return (f"⚠️ @{username} is currently marked as away until {return_date}. Consider assigning someone else or waiting."), False
     current_assignees, assignee_error = _current_assignees_or_error(bot, issue_number)
     if assignee_error:
         return assignee_error, False
@@ -601,7 +616,7 @@ def handle_assign_command(
         "manual",
         current_assignees=current_assignees,
     )
-    prev_text = f" (previously: @{', @'.join(current_assignees)})" if current_assignees else ""
+    prev_text = _previous_assignees_text(current_assignees)
     if result.get("confirmed"):
         return f"✅ @{username} has been assigned as reviewer{prev_text}.", True
     return _assignment_failure_response(username, result), False, bool(
@@ -643,7 +658,7 @@ def handle_assign_from_queue_command(
         "round-robin",
         current_assignees=current_assignees,
     )
-    prev_text = f" (previously: @{', @'.join(current_assignees)})" if current_assignees else ""
+    prev_text = _previous_assignees_text(current_assignees)
     if result.get("confirmed"):
         return f"✅ @{next_reviewer} (next in queue) has been assigned as reviewer{prev_text}.", True
     return _assignment_failure_response(next_reviewer, result), False, bool(
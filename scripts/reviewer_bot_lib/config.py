@@ -7,7 +7,7 @@ BOT_NAME = "guidelines-bot"
 BOT_MENTION = f"@{BOT_NAME}"
 CODING_GUIDELINE_LABEL = "coding guideline"
 FLS_AUDIT_LABEL = "fls-audit"
-REVIEW_LABELS = {CODING_GUIDELINE_LABEL, FLS_AUDIT_LABEL}
+REVIEW_LABELS = frozenset({CODING_GUIDELINE_LABEL, FLS_AUDIT_LABEL})
 STATE_ISSUE_NUMBER_ENV = "STATE_ISSUE_NUMBER"
 STATE_ISSUE_NUMBER = 0
 MEMBERS_URL = (
@@ -251,16 +251,17 @@ def _read_workflow_run_name(bot: EventInputsContext) -> str:
 
 
 def build_event_context(bot: EventInputsContext) -> EventContext:
+    event_name = bot.get_config_value("EVENT_NAME").strip()
     workflow_kind = bot.get_config_value("REVIEWER_BOT_WORKFLOW_KIND").strip() or None
     workflow_artifact_contract = None
-    if bot.get_config_value("EVENT_NAME").strip() == "workflow_run":
+    if event_name == "workflow_run":
         workflow_artifact_contract = (
             "artifact_optional_router"
             if _read_workflow_run_name(bot) == "Reviewer Bot PR Comment Router"
             else "artifact_required"
         )
     return EventContext(
-        event_name=bot.get_config_value("EVENT_NAME").strip(),
+        event_name=event_name,
         event_action=bot.get_config_value("EVENT_ACTION").strip(),
         issue_number=_parse_optional_int(bot.get_config_value("ISSUE_NUMBER")),
         is_pull_request=_parse_optional_bool(bot.get_config_value("IS_PULL_REQUEST")),
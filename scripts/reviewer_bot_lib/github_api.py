@@ -516,11 +516,11 @@ def list_issue_comments_result(
     )
 
 
-def get_repo_labels(bot: GitHubTransportContext) -> set[str]:
+def get_repo_labels(bot: GitHubTransportContext) -> frozenset[str]:
     result = bot.github_api("GET", "labels?per_page=100")
     if result and isinstance(result, list):
-        return {label["name"] for label in result}
-    return set()
+        return frozenset(label["name"] for label in result)
+    return frozenset()
 
 
 def add_label(bot: GitHubTransportContext, issue_number: int, label: str) -> bool:
@@ -743,32 +743,40 @@ def add_reaction(bot: GitHubTransportContext, comment_id: int, reaction: str) ->
     )
 
 
-def remove_issue_assignee(bot: GitHubTransportContext, issue_number: int, username: str):
+def remove_issue_assignees(bot: GitHubTransportContext, issue_number: int, usernames: list[str]):
     return _request_assignment_write(
         bot,
         "DELETE",
         f"issues/{issue_number}/assignees",
-        {"assignees": [username]},
+        {"assignees": list(usernames)},
         assignment_target="issue assignee removal",
         issue_number=issue_number,
-        username=username,
+        username=", @".join(usernames),
         success_statuses={200, 204},
     )
 
 
-def remove_pr_reviewer(bot: GitHubTransportContext, issue_number: int, username: str):
+def remove_issue_assignee(bot: GitHubTransportContext, issue_number: int, username: str):
+    return remove_issue_assignees(bot, issue_number, [username])
+
+
+def remove_pr_reviewers(bot: GitHubTransportContext, issue_number: int, usernames: list[str]):
     return _request_assignment_write(
         bot,
         "DELETE",
         f"pulls/{issue_number}/requested_reviewers",
-        {"reviewers": [username]},
+        {"reviewers": list(usernames)},
         assignment_target="PR reviewer removal",
         issue_number=issue_number,
-        username=username,
+        username=", @".join(usernames),
         success_statuses={200, 204},
     )
 
 
+def remove_pr_reviewer(bot: GitHubTransportContext, issue_number: int, username: str):
+    return remove_pr_reviewers(bot, issue_number, [username])
+
+
 def get_user_permission_status(
     bot: GitHubTransportContext,
     username: str,
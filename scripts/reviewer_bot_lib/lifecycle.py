@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterable
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -217,8 +218,8 @@ _If you believe this is in error or have extenuating circumstances, please reach
     return True
 
 
-def _tracked_review_issue(bot, labels: list[str]) -> bool:
-    return any(label in bot.REVIEW_LABELS for label in labels)
+def _tracked_review_issue(bot, labels: Iterable[str]) -> bool:
+    return not bot.REVIEW_LABELS.isdisjoint(labels)
 
 
 def _reconcile_lifecycle_reviewer_authority(
@@ -396,10 +397,11 @@ def handle_labeled_event(bot, state: dict) -> bool:
     if label_name == "sign-off: create pr":
         if is_pr:
             return False
-        if CODING_GUIDELINE_LABEL not in set(request.issue_labels):
+        if CODING_GUIDELINE_LABEL not in request.issue_labels:
             return False
-        review_data = ensure_review_entry(state, issue_number)
-        reviewer = review_data.get("current_reviewer") if review_data else None
+        # mark_review_complete normalizes the entry itself; only the reviewer is needed here.
+        review_data = state.get("active_reviews", {}).get(str(issue_number))
+        reviewer = review_data.get("current_reviewer") if isinstance(review_data, dict) else None
         return mark_review_complete(state, issue_number, reviewer, "issue_label: sign-off: create pr")
     if label_name not in bot.REVIEW_LABELS:
         return False
@@ -422,7 +424,7 @@ def handle_unlabeled_event(bot, state: dict) -> bool:
         and review_data.get("review_completion_source") == "issue_label: sign-off: create pr"
     ):
         changed = _clear_completion(review_data) or changed
-    if request.label_name in bot.REVIEW_LABELS and not _tracked_review_issue(bot, list(request.issue_labels)):
+    if request.label_name in bot.REVIEW_LABELS and not _tracked_review_issue(bot, request.issue_labels):
         changed = assignment_flow.clear_reviewer_authority(bot, state, request.issue_number, reason="review_label_removed") or changed
     return changed
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -25,6 +26,7 @@ from .reviews_projection import status_label_projection_output
 
 ScheduleHandlerResult = maintenance_schedule.ScheduleHandlerResult
 SCHEDULE_LIKE_MANUAL_ACTIONS = frozenset({"check-overdue"})
+_SHOW_STATE_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 _PENDING_ISSUE314_REPAIR_SUMMARY_ATTR = "_reviewer_bot_pending_issue314_state_health_repair_summary"
 _now_iso = maintenance_privileged._now_iso
 _finalize_schedule_result = maintenance_schedule._finalize_schedule_result
@@ -432,7 +434,8 @@ def handle_manual_dispatch_result(bot, state: dict) -> ScheduleHandlerResult:
 def _handle_manual_dispatch_request(bot, state: dict, request) -> bool:
     action = request.action
     if action == "show-state":
-        print(f"Current state:\n{yaml.dump(state, default_flow_style=False)}")
+        print("Current state:")
+        yaml.dump(state, sys.stdout, Dumper=_SHOW_STATE_YAML_DUMPER, default_flow_style=False)
         return False
     if action == "preview-check-overdue":
         _emit_preview_json(_preview_output_base(bot, state, request))
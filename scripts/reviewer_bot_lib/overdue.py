@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from . import assignment_flow
 from .config import TRANSITION_NOTICE_MARKER_PREFIX, TRANSITION_WARNING_MARKER_PREFIX
@@ -170,6 +170,7 @@ def _scoped_delivery_receipt(
     if not isinstance(receipts, dict):
         return None
     candidates: list[tuple[str, ReminderScopeReceipt]] = []
+    reviewer_key = reviewer.lower() if reviewer else None
     for row in receipts.values():
         if not isinstance(row, dict):
             continue
@@ -177,7 +178,7 @@ def _scoped_delivery_receipt(
         if scope_key is not None and row_scope != scope_key:
             continue
         row_reviewer = row.get("reviewer") if isinstance(row.get("reviewer"), str) else None
-        if reviewer and (not row_reviewer or row_reviewer.lower() != reviewer.lower()):
+        if reviewer_key and (not row_reviewer or row_reviewer.lower() != reviewer_key):
             continue
         row_head = row.get("head_sha") if isinstance(row.get("head_sha"), str) else None
         if head_sha and row_head != head_sha:
@@ -922,6 +923,7 @@ def check_overdue_reviews(bot, state: dict) -> list[dict]:
         return []
 
     now = bot.datetime.now(bot.timezone.utc)
+    activity_cutoff = now - timedelta(days=bot.REVIEW_DEADLINE_DAYS)
     overdue = []
 
     for issue_key, review_data in state["active_reviews"].items():
@@ -1014,14 +1016,11 @@ def check_overdue_reviews(bot, state: dict) -> list[dict]:
             continue
 
         last_activity_dt = _parse_reminder_timestamp(last_activity)
-        if last_activity_dt is None:
+        if last_activity_dt is None or last_activity_dt > activity_cutoff:
             continue
 
         days_since_activity = (now - last_activity_dt).days
 
-        if days_since_activity < bot.REVIEW_DEADLINE_DAYS:
-            continue
-
         if reminder_decision.action == "transition":
             warning_dt = _parse_reminder_timestamp(
                 reminder_decision.receipt.created_at if reminder_decision.receipt is not None else None
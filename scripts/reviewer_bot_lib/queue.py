@@ -57,20 +57,39 @@ def sync_members_with_queue(bot, state: dict) -> tuple[dict, list[str]]:
     return state, changes
 
 
+def login_key(username: str) -> str:
+    """Return the case-insensitive comparison key for a GitHub login."""
+    return username.lstrip("@").casefold()
+
+
+def _member_index(members: list[dict], username_key: str) -> int | None:
+    for index, member in enumerate(members):
+        if login_key(member["github"]) == username_key:
+            return index
+    return None
+
+
+def find_member_index(members: list[dict], username: str) -> int | None:
+    """Return the index of ``username`` in a queue or pass-until list, ignoring case."""
+    return _member_index(members, login_key(username))
+
+
+def find_member_indices(state: dict, username: str) -> tuple[int | None, int | None]:
+    """Return the queue and pass-until indices of ``username``, ignoring case."""
+    username_key = login_key(username)
+    return (
+        _member_index(state["queue"], username_key),
+        _member_index(state.get("pass_until", []), username_key),
+    )
+
+
 def reposition_member_as_next(state: dict, username: str) -> bool:
     """Move a queue member to current_index so they are next up."""
-    user_index = None
-    user_entry = None
-    for index, member in enumerate(state["queue"]):
-        if member["github"].lower() == username.lower():
-            user_index = index
-            user_entry = member
-            break
-
-    if user_entry is None or user_index is None:
+    user_index = find_member_index(state["queue"], username)
+    if user_index is None:
         return False
 
-    state["queue"].pop(user_index)
+    user_entry = state["queue"].pop(user_index)
 
     if user_index < state["current_index"]:
         state["current_index"] -= 1
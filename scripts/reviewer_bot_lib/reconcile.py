@@ -682,9 +682,10 @@ def reconcile_active_review_entry(
     assigned_reviewer = review_data.get("current_reviewer")
     if not assigned_reviewer:
         return f"ℹ️ #{issue_number} has no tracked assigned reviewer; nothing to rectify.", True, False
-    if require_pull_request_context and bot.get_config_value("IS_PULL_REQUEST", "false").lower() != "true":
+    is_pull_request = bot.get_config_value("IS_PULL_REQUEST", "false").lower() == "true"
+    if require_pull_request_context and not is_pull_request:
         return f"ℹ️ #{issue_number} is not a pull request in this event context; `/rectify` only reconciles PR reviews.", True, False
-    if str(state.get("freshness_runtime_epoch", "")).strip() != "freshness_v15" and bot.get_config_value("IS_PULL_REQUEST", "false").lower() == "true":
+    if str(state.get("freshness_runtime_epoch", "")).strip() != "freshness_v15" and is_pull_request:
         return "ℹ️ PR review freshness rectify is epoch-gated and currently inactive.", True, False
     head_repair_result = bot.adapters.review_state.maybe_record_head_observation_repair(issue_number, review_data)
     state_changed = head_repair_result.changed
@@ -40,9 +40,10 @@ parse_github_timestamp = live_review_support.parse_github_timestamp
 def get_latest_review_by_reviewer(bot, reviews: list[dict], reviewer: str) -> dict | None:
     latest_review = None
     latest_key = (datetime.min.replace(tzinfo=timezone.utc), "")
+    reviewer_key = reviewer.lower()
     for review in reviews:
         author = review.get("user", {}).get("login")
-        if not isinstance(author, str) or author.lower() != reviewer.lower():
+        if not isinstance(author, str) or author.lower() != reviewer_key:
             continue
         submitted_at = parse_github_timestamp(review.get("submitted_at"))
         if submitted_at is None:
@@ -74,11 +75,12 @@ def get_latest_valid_current_reviewer_review_for_cycle(
         return None
     latest_review = None
     latest_key = (datetime.min.replace(tzinfo=timezone.utc), "")
+    reviewer_key = current_reviewer.lower()
     for review in reviews:
         if not isinstance(review, dict):
             continue
         author = review.get("user", {}).get("login")
-        if not isinstance(author, str) or author.lower() != current_reviewer.lower():
+        if not isinstance(author, str) or author.lower() != reviewer_key:
             continue
         state = str(review.get("state", "")).upper()
         if state not in {"APPROVED", "COMMENTED", "CHANGES_REQUESTED"}:
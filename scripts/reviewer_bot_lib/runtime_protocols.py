@@ -199,8 +199,12 @@ class GitHubTransportContext(GitHubApiContext, Protocol):
 
     def remove_issue_assignee(self, issue_number: int, username: str) -> AssignmentAttempt: ...
 
+    def remove_issue_assignees(self, issue_number: int, usernames: list[str]) -> AssignmentAttempt: ...
+
     def remove_pr_reviewer(self, issue_number: int, username: str) -> AssignmentAttempt: ...
 
+    def remove_pr_reviewers(self, issue_number: int, usernames: list[str]) -> AssignmentAttempt: ...
+
 
 @runtime_checkable
 class StateStoreRuntimeContext(Protocol):
@@ -11,7 +11,7 @@ def parse_iso8601_utc(value: Any) -> datetime | None:
         timestamp = value
     elif isinstance(value, str) and value.strip():
         try:
-            timestamp = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+            timestamp = datetime.fromisoformat(value.strip())
         except ValueError:
             return None
     else:
@@ -11,13 +11,16 @@ This module provides common functionality used by:
 - check_rust_examples.py: Validate and test examples
 """
 
+import functools
 import json
+import os
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Regex patterns for parsing RST
 RST_CODE_BLOCK_PATTERN = re.compile(
@@ -36,8 +39,24 @@ RST_OPTION_PATTERN = re.compile(r'^(\s+):(\w+):(.*)$')
 # Pattern to extract content indentation
 RST_CONTENT_INDENT_PATTERN = re.compile(r'^(\s+)(\S)')
 
+# Patterns used to decide whether example code needs a main() wrapper
+MAIN_FN_PATTERN = re.compile(r'\bfn\s+main\s*\(')
+FN_ITEM_PATTERN = re.compile(r'\bfn\s+\w+\s*[<(]')
+ITEM_KEYWORD_PATTERN = re.compile(r'\b(impl|struct|enum|trait|use|mod|const|static|type)\b')
 
-@dataclass
+# Keywords that mark code as top-level items that must not be wrapped
+ITEM_KEYWORDS = frozenset({'impl', 'struct', 'enum', 'trait', 'mod', 'type'})
+# Keywords whose leading declarations stay outside the generated main()
+TOP_LEVEL_DECLARATION_KEYWORDS = frozenset({'use', 'const', 'static'})
+
+# Compiler output lines that report a warning
+WARNING_LINE_PATTERN = re.compile(r'^.*warning(?::|\[).*$', re.MULTILINE)
+
+# Characters not allowed in a generated Rust identifier
+NON_IDENTIFIER_CHAR_PATTERN = re.compile(r'[^a-zA-Z0-9_]')
+
+
+@dataclass(slots=True)
 class RustExample:
     """Represents a Rust code example extracted from documentation."""
     
@@ -112,7 +131,7 @@ class RustExample:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of testing a single Rust example."""
     
@@ -175,6 +194,37 @@ def process_hidden_lines(code: str) -> Tuple[str, str]:
     return '\n'.join(display_lines), '\n'.join(full_lines)
 
 
+@functools.cache
+def get_rustc_path() -> str:
+    """
+    Resolve the rustc executable once per process.
+    
+    Honors the RUSTC environment variable. Otherwise the active toolchain's
+    sysroot is looked up once, so each example compile runs that rustc
+    directly instead of going through the rustup proxy again.
+    
+    Returns:
+        Path to rustc, or "rustc" if it cannot be resolved
+    """
+    rustc = os.environ.get('RUSTC', '').strip()
+    if rustc:
+        return rustc
+    try:
+        result = subprocess.run(
+            ['rustc', '--print', 'sysroot'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return 'rustc'
+    if result.returncode != 0:
+        return 'rustc'
+    candidate = Path(result.stdout.strip()) / 'bin' / 'rustc'
+    return str(candidate) if candidate.is_file() else 'rustc'
+
+
+@functools.cache
 def get_rust_version() -> Tuple[Optional[str], str]:
     """
     Get the current Rust compiler version and channel.
@@ -186,7 +236,7 @@ def get_rust_version() -> Tuple[Optional[str], str]:
     """
     try:
         result = subprocess.run(
-            ['rustc', '--version'],
+            [get_rustc_path(), '--version'],
             capture_output=True,
             text=True,
             timeout=10
@@ -206,7 +256,7 @@ def get_rust_version() -> Tuple[Optional[str], str]:
                 channel = "stable"  # Release versions without suffix are stable
             return version, channel
         return None, "unknown"
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+    except (subprocess.TimeoutExpired, OSError):
         return None, "unknown"
 
 
@@ -298,28 +348,19 @@ def wrap_in_main(code: str) -> str:
     This is similar to what rustdoc does for doc tests.
     """
     # Check if code already has a main function
-    if re.search(r'\bfn\s+main\s*\(', code):
+    if MAIN_FN_PATTERN.search(code):
         return code
     
-    # Check if it has any function definitions at all
-    has_functions = re.search(r'\bfn\s+\w+\s*[<(]', code)
-    has_impl = re.search(r'\bimpl\b', code)
-    has_struct = re.search(r'\bstruct\b', code)
-    has_enum = re.search(r'\benum\b', code)
-    has_trait = re.search(r'\btrait\b', code)
-    has_use = re.search(r'\buse\b', code)
-    has_mod = re.search(r'\bmod\b', code)
-    has_const = re.search(r'\bconst\b', code)
-    has_static = re.search(r'\bstatic\b', code)
-    has_type = re.search(r'\btype\b', code)
+    # Find which item keywords appear, in a single pass over the code
+    keywords = set(ITEM_KEYWORD_PATTERN.findall(code))
     
     # If it looks like top-level items, don't wrap
-    if has_functions or has_impl or has_struct or has_enum or has_trait or has_mod or has_type:
+    if FN_ITEM_PATTERN.search(code) or not keywords.isdisjoint(ITEM_KEYWORDS):
         # But we might still need a main if there's code outside functions
         return code
     
     # If it's just statements, wrap in main
-    if has_use or has_const or has_static:
+    if not keywords.isdisjoint(TOP_LEVEL_DECLARATION_KEYWORDS):
         # Keep use/const/static at top level, wrap the rest
         lines = code.split('\n')
         top_level = []
@@ -491,10 +532,13 @@ def generate_lib_rs(examples: List[RustExample], prelude: str = "") -> str:
     sections.append("//! Each example is tested as a rustdoc test.")
     sections.append("")
     
+    # The prelude is the same hidden block for every example
+    prelude_lines = [f"/// # {line}" for line in prelude.split('\n') if line.strip()]
+    
     for i, example in enumerate(examples):
         # Generate a unique function/module for each example
         example_id = example.example_name or f"example_{i}"
-        safe_id = re.sub(r'[^a-zA-Z0-9_]', '_', example_id)
+        safe_id = NON_IDENTIFIER_CHAR_PATTERN.sub('_', example_id)
         
         # Build the rustdoc attribute
         attr_line = ""
@@ -523,15 +567,10 @@ def generate_lib_rs(examples: List[RustExample], prelude: str = "") -> str:
         sections.append(attr_line)
         
         # Add prelude as hidden lines if present
-        if prelude:
-            for line in prelude.split('\n'):
-                if line.strip():
-                    sections.append(f"/// # {line}")
+        sections.extend(prelude_lines)
         
         # Add the example code
-        code = example.code
-        for line in code.split('\n'):
-            sections.append(f"/// {line}")
+        sections.extend(f"/// {line}" for line in example.code.split('\n'))
         
         sections.append("/// ```")
         sections.append(f"pub fn {safe_id}() {{}}")
@@ -630,10 +669,13 @@ def compile_single_example(
         src_file.write_text(code)
         
         try:
-            out_file = Path(tmpdir) / "test_binary"
+            # The binary is never run, so stop after codegen and skip the link step.
+            # Codegen still runs, which keeps overflow lints and post-monomorphization
+            # errors that --emit=metadata would miss.
+            out_file = Path(tmpdir) / "test.o"
             edition = example.edition or "2021"
             result = subprocess.run(
-                ["rustc", f"--edition={edition}", "--crate-type=bin", "-o", str(out_file), str(src_file)],
+                [get_rustc_path(), f"--edition={edition}", "--crate-type=bin", "--emit=obj", "-o", str(out_file), str(src_file)],
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -643,11 +685,7 @@ def compile_single_example(
             compiler_output = result.stderr
             
             # Check for warnings
-            warnings = []
-            if 'warning:' in compiler_output or 'warning[' in compiler_output:
-                for line in compiler_output.split('\n'):
-                    if 'warning:' in line or 'warning[' in line:
-                        warnings.append(line)
+            warnings = WARNING_LINE_PATTERN.findall(compiler_output)
             
             if should_fail:
                 # Expected to fail
@@ -733,6 +771,43 @@ def compile_single_example(
             )
 
 
+def compile_examples(
+    examples: List[RustExample],
+    prelude: str = "",
+    current_version: Optional[str] = None,
+    current_channel: str = "stable",
+    jobs: Optional[int] = None
+) -> Iterator[TestResult]:
+    """
+    Compile examples concurrently, yielding results in input order.
+    
+    Each example compiles in its own rustc process and temporary directory,
+    so the work is independent; threads only wait on those processes.
+    
+    Args:
+        examples: The examples to compile
+        prelude: Optional prelude code
+        current_version: Current Rust version
+        current_channel: Current Rust channel
+        jobs: Maximum concurrent compiles (defaults to the CPU count)
+        
+    Returns:
+        Iterator of TestResult, one per example, in the order given
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(examples)))
+    
+    def compile_one(example: RustExample) -> TestResult:
+        return compile_single_example(
+            example,
+            prelude,
+            current_version=current_version,
+            current_channel=current_channel
+        )
+    
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(compile_one, examples)
+
+
 def format_test_results(results: List[TestResult]) -> str:
     """
     Format test results for display.
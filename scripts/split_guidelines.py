@@ -32,12 +32,14 @@ Usage:
 """
 
 import argparse
+import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from scripts.common.guideline_pages import (
+    GUIDELINE_FILE_HEADER,
     build_guideline_page_content,
     extract_guideline_title,
 )
@@ -51,6 +53,48 @@ GUIDELINE_PATTERN = re.compile(
 # Pattern to extract guideline ID from :id: option
 ID_PATTERN = re.compile(r':id:\s*(gui_[A-Za-z0-9_]+)')
 
+# Pattern for the SPDX and default-domain lines stripped from the chapter
+# header (fresh ones are written out)
+HEADER_STRIP_PATTERN = re.compile(
+    r'\.\. SPDX-License-Identifier:.*?\n'
+    r'|\s*SPDX-FileCopyrightText:.*?\n'
+    r'|\.\. default-domain::.*?\n\n?'
+)
+
+# Toctree listing the guideline pages of a chapter index
+CHAPTER_TOCTREE = (
+    ".. toctree::",
+    "   :maxdepth: 1",
+    "   :titlesonly:",
+    "   :glob:",
+    "",
+    "   gui_*",
+    "",
+)
+
+# Known chapter files based on index.rst toctree
+KNOWN_CHAPTERS = (
+    "types-and-traits",
+    "patterns",
+    "expressions",
+    "values",
+    "statements",
+    "functions",
+    "associated-items",
+    "implementations",
+    "generics",
+    "attributes",
+    "entities-and-resolution",
+    "ownership-and-destruction",
+    "exceptions-and-errors",
+    "concurrency",
+    "program-structure-and-compilation",
+    "unsafety",
+    "macros",
+    "ffi",
+    "inline-assembly",
+)
+
 
 def find_guideline_boundaries(content: str) -> List[Tuple[int, int, str]]:
     """
@@ -60,20 +104,14 @@ def find_guideline_boundaries(content: str) -> List[Tuple[int, int, str]]:
         List of (start_pos, end_pos, guideline_id) tuples
     """
     boundaries = []
-    matches = list(GUIDELINE_PATTERN.finditer(content))
+    starts = [match.start() for match in GUIDELINE_PATTERN.finditer(content)]
     
-    for i, match in enumerate(matches):
-        start = match.start()
-        
-        # End is either the start of the next guideline or end of file
-        if i + 1 < len(matches):
-            end = matches[i + 1].start()
-        else:
-            end = len(content)
-        
-        # Extract the guideline content to find the ID
-        guideline_content = content[start:end]
-        id_match = ID_PATTERN.search(guideline_content)
+    # End is either the start of the next guideline or end of file
+    ends = [*starts[1:], len(content)]
+    
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        # Search for the ID within this guideline without slicing it out
+        id_match = ID_PATTERN.search(content, start, end)
         
         if id_match:
             guideline_id = id_match.group(1)
@@ -96,16 +134,25 @@ def extract_chapter_header(content: str, first_guideline_start: int) -> str:
     """
     header = content[:first_guideline_start]
     
-    # Remove existing SPDX header
-    header = re.sub(r'\.\. SPDX-License-Identifier:.*?\n', '', header)
-    header = re.sub(r'\s*SPDX-FileCopyrightText:.*?\n', '', header)
-    
-    # Remove existing default-domain
-    header = re.sub(r'\.\. default-domain::.*?\n\n?', '', header)
+    # Remove existing SPDX header and default-domain in one pass
+    header = HEADER_STRIP_PATTERN.sub('', header)
     
     return header.strip()
 
 
+def split_chapter_title(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a leading '=' underlined title off the start of the text.
+    
+    Returns:
+        Tuple of (title, remaining_text), or None if the text does not start with a title
+    """
+    first_line, newline, rest = text.partition("\n")
+    if not first_line or not newline or not rest.startswith("="):
+        return None
+    return first_line.strip(), rest.lstrip("=")
+
+
 def extract_guideline_content(content: str, start: int, end: int) -> str:
     """
     Extract a single guideline's content.
@@ -128,10 +175,7 @@ def generate_chapter_index(chapter_name: str, chapter_title: str, guideline_ids:
         header_content: Optional introductory content after the title
     """
     lines = [
-        ".. SPDX-License-Identifier: MIT OR Apache-2.0",
-        "   SPDX-FileCopyrightText: The Coding Guidelines Subcommittee Contributors",
-        "",
-        ".. default-domain:: coding-guidelines",
+        GUIDELINE_FILE_HEADER.rstrip(),
         "",
         chapter_title,
         "=" * len(chapter_title),
@@ -139,19 +183,10 @@ def generate_chapter_index(chapter_name: str, chapter_title: str, guideline_ids:
     ]
     
     if header_content:
-        lines.append(header_content)
-        lines.append("")
+        lines += (header_content, "")
     
     if guideline_ids:
-        lines.extend([
-            ".. toctree::",
-            "   :maxdepth: 1",
-            "   :titlesonly:",
-            "   :glob:",
-            "",
-            "   gui_*",
-            "",
-        ])
+        lines += CHAPTER_TOCTREE
 
     lines.append("")  # Trailing newline
     
@@ -173,9 +208,9 @@ def parse_chapter_file(filepath: Path) -> Tuple[str, str, List[Tuple[str, str]]]
     
     if not boundaries:
         # Empty chapter - extract title from content
-        title_match = re.search(r'^([^\n]+)\n=+', content)
-        if title_match:
-            chapter_title = title_match.group(1).strip()
+        title_split = split_chapter_title(content)
+        if title_split:
+            chapter_title = title_split[0]
         else:
             chapter_title = filepath.stem.replace("-", " ").title()
         return chapter_title, "", []
@@ -184,11 +219,11 @@ def parse_chapter_file(filepath: Path) -> Tuple[str, str, List[Tuple[str, str]]]
     header = extract_chapter_header(content, boundaries[0][0])
     
     # Extract chapter title from header
-    title_match = re.search(r'^([^\n]+)\n=+', header)
-    if title_match:
-        chapter_title = title_match.group(1).strip()
+    title_split = split_chapter_title(header)
+    if title_split:
         # Remove title from header content
-        header = header[title_match.end():].strip()
+        chapter_title, header = title_split
+        header = header.strip()
     else:
         chapter_title = filepath.stem.replace("-", " ").title()
     
@@ -255,7 +290,7 @@ def split_chapter(
 
         guideline_title = extract_guideline_title(content) or f"Guideline {gid}"
         full_content = build_guideline_page_content(guideline_title, content)
-        guideline_file.write_text(full_content)
+        guideline_file.write_bytes(full_content.encode("utf-8"))
         
         if verbose:
             print(f"  Created {guideline_file.name}")
@@ -268,7 +303,7 @@ def split_chapter(
         header_content
     )
     index_file = chapter_dir / "index.rst"
-    index_file.write_text(index_content)
+    index_file.write_bytes(index_content.encode("utf-8"))
     print(f"  Created {index_file}")
     
     return len(guidelines), guideline_ids
@@ -291,18 +326,22 @@ def update_main_index(
     content = index_file.read_text()
     original = content
     
-    updated_chapters = []
-    for chapter in chapter_names:
+    matched_chapters = set()
+    if chapter_names:
         # Replace 'chapter' with 'chapter/index' in toctree
-        # Match the chapter name at the end of a line (with optional trailing whitespace)
+        # Match a chapter name at the end of a line (with optional trailing whitespace)
         # but only if it's not already followed by /index
-        pattern = rf'(^[ \t]+){re.escape(chapter)}([ \t]*$)'
+        pattern = re.compile(
+            r'(^[ \t]+)(' + '|'.join(re.escape(chapter) for chapter in chapter_names) + r')([ \t]*$)',
+            re.MULTILINE
+        )
         
-        # Check if this chapter is in the content and not already updated
-        if re.search(pattern, content, re.MULTILINE):
-            replacement = rf'\g<1>{chapter}/index\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-            updated_chapters.append(chapter)
+        def add_index(match: re.Match) -> str:
+            matched_chapters.add(match.group(2))
+            return f"{match.group(1)}{match.group(2)}/index{match.group(3)}"
+        
+        content = pattern.sub(add_index, content)
+    updated_chapters = [chapter for chapter in chapter_names if chapter in matched_chapters]
     
     if content != original:
         if dry_run:
@@ -320,36 +359,8 @@ def get_chapter_files(src_dir: Path) -> List[Path]:
     """
     Get list of chapter RST files (excluding index.rst and non-guideline files).
     """
-    # These are known chapter files based on index.rst toctree
-    known_chapters = [
-        "types-and-traits",
-        "patterns",
-        "expressions",
-        "values",
-        "statements",
-        "functions",
-        "associated-items",
-        "implementations",
-        "generics",
-        "attributes",
-        "entities-and-resolution",
-        "ownership-and-destruction",
-        "exceptions-and-errors",
-        "concurrency",
-        "program-structure-and-compilation",
-        "unsafety",
-        "macros",
-        "ffi",
-        "inline-assembly",
-    ]
-    
-    chapter_files = []
-    for name in known_chapters:
-        filepath = src_dir / f"{name}.rst"
-        if filepath.exists():
-            chapter_files.append(filepath)
-    
-    return chapter_files
+    present = {entry.name for entry in os.scandir(src_dir) if entry.is_file()}
+    return [src_dir / f"{name}.rst" for name in KNOWN_CHAPTERS if f"{name}.rst" in present]
 
 
 def main():
@@ -458,9 +469,11 @@ def main():
         print("\n=== Cleaning up old chapter files ===")
         for chapter in processed_chapters:
             old_file = src_dir / f"{chapter}.rst"
-            if old_file.exists():
+            try:
                 old_file.unlink()
-                print(f"  Removed {old_file}")
+            except FileNotFoundError:
+                continue
+            print(f"  Removed {old_file}")
     elif args.cleanup and args.dry_run:
         print("\n=== Would remove these old chapter files ===")
         for chapter in processed_chapters:
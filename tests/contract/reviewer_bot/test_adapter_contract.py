@@ -123,6 +123,68 @@ def test_bootstrapped_runtime_supports_typed_rest_and_assignment_paths(monkeypat
     assert attempt.success is True
 
 
+def test_bootstrapped_runtime_reads_repo_labels_and_default_branch_once_per_run(monkeypatch):
+    runtime = reviewer_bot._runtime_bot()
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    requested = []
+
+    def request(method, url, **kwargs):
+        requested.append(url)
+        if url.endswith("/labels?per_page=100"):
+            return FakeGitHubResponse(200, [{"name": "sign-off: create pr"}], "ok")
+        return FakeGitHubResponse(200, {"default_branch": "trunk"}, "ok")
+
+    runtime.rest_transport = SimpleNamespace(request=request)
+
+    assert runtime.github.get_repo_labels() == frozenset({"sign-off: create pr"})
+    assert runtime.github.get_repo_labels() == frozenset({"sign-off: create pr"})
+    assert runtime.adapters.automation.get_default_branch() == "trunk"
+    assert runtime.adapters.automation.get_default_branch() == "trunk"
+    assert len(requested) == 2
+
+
+def test_bootstrapped_runtime_reuses_resolved_permission_status_within_run(monkeypatch):
+    runtime = reviewer_bot._runtime_bot()
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    responses = [
+        FakeGitHubResponse(404, {"message": "Not Found"}, "not found"),
+        FakeGitHubResponse(200, {"user": {"permissions": {"triage": True}}}, "ok"),
+    ]
+    requested = []
+
+    def request(method, url, **kwargs):
+        requested.append(url)
+        return responses.pop(0)
+
+    runtime.rest_transport = SimpleNamespace(request=request)
+
+    assert runtime.github.get_user_permission_status("Alice") == "unavailable"
+    assert runtime.github.get_user_permission_status("alice") == "granted"
+    assert runtime.github.check_user_permission("ALICE") is True
+    assert len(requested) == 2
+
+
+def test_bootstrapped_runtime_ensures_each_label_once_per_run(monkeypatch):
+    runtime = reviewer_bot._runtime_bot()
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    responses = [
+        FakeGitHubResponse(500, {"message": "boom"}, "boom"),
+        FakeGitHubResponse(422, {"message": "already_exists"}, "already_exists"),
+    ]
+    requested = []
+
+    def request(method, url, **kwargs):
+        requested.append((method, url))
+        return responses.pop(0)
+
+    runtime.rest_transport = SimpleNamespace(request=request)
+
+    assert runtime.github.ensure_label_exists("triage approver required") is False
+    assert runtime.github.ensure_label_exists("triage approver required") is True
+    assert runtime.github.ensure_label_exists("triage approver required") is True
+    assert len(requested) == 2
+
+
 def _protocol_member_names(protocol_type) -> set[str]:
     return set(protocol_type.__annotations__) | {
         name
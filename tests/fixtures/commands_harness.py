@@ -133,10 +133,16 @@ class CommandHarness:
         )
         self.runtime.github.remove_pr_reviewer = self._remove_live_assignee
         self.runtime.github.remove_issue_assignee = self._remove_live_assignee
+        self.runtime.github.remove_pr_reviewers = self._remove_live_assignees
+        self.runtime.github.remove_issue_assignees = self._remove_live_assignees
 
     def _remove_live_assignee(self, issue_number, username):
+        return self._remove_live_assignees(issue_number, [username])
+
+    def _remove_live_assignees(self, issue_number, usernames):
         del issue_number
-        self._live_assignees = [assignee for assignee in self._live_assignees if assignee.lower() != username.lower()]
+        removed = {username.lower() for username in usernames}
+        self._live_assignees = [assignee for assignee in self._live_assignees if assignee.lower() not in removed]
         return True
 
     def stub_assignment(self, *, success: bool = True, status_code: int = 201):
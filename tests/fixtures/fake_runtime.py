@@ -279,9 +279,15 @@ class FakeRuntimeGitHubCompatibility:
     def remove_issue_assignee(self, issue_number: int, username: str) -> bool:
         return github_api_module.remove_issue_assignee(self._runtime, issue_number, username)
 
+    def remove_issue_assignees(self, issue_number: int, usernames: list[str]) -> bool:
+        return github_api_module.remove_issue_assignees(self._runtime, issue_number, usernames)
+
     def remove_pr_reviewer(self, issue_number: int, username: str) -> bool:
         return github_api_module.remove_pr_reviewer(self._runtime, issue_number, username)
 
+    def remove_pr_reviewers(self, issue_number: int, usernames: list[str]) -> bool:
+        return github_api_module.remove_pr_reviewers(self._runtime, issue_number, usernames)
+
     def get_issue_or_pr_snapshot(self, issue_number: int) -> dict | None:
         return github_api_module.get_issue_or_pr_snapshot(self._runtime, issue_number)
 
@@ -742,9 +748,15 @@ class FakeReviewerBotRuntime:
     def remove_issue_assignee(self, issue_number: int, username: str) -> bool:
         return self.compat.github.remove_issue_assignee(issue_number, username)
 
+    def remove_issue_assignees(self, issue_number: int, usernames: list[str]) -> bool:
+        return self.compat.github.remove_issue_assignees(issue_number, usernames)
+
     def remove_pr_reviewer(self, issue_number: int, username: str) -> bool:
         return self.compat.github.remove_pr_reviewer(issue_number, username)
 
+    def remove_pr_reviewers(self, issue_number: int, usernames: list[str]) -> bool:
+        return self.compat.github.remove_pr_reviewers(issue_number, usernames)
+
     def get_issue_or_pr_snapshot(self, issue_number: int) -> dict | None:
         return self.compat.github.get_issue_or_pr_snapshot(issue_number)
 
@@ -240,11 +240,21 @@ class GitHubStub:
 
         return github_api_module.remove_issue_assignee(self._runtime_required(), issue_number, username)
 
+    def remove_issue_assignees(self, issue_number: int, usernames: list[str]):
+        from scripts.reviewer_bot_lib import github_api as github_api_module
+
+        return github_api_module.remove_issue_assignees(self._runtime_required(), issue_number, usernames)
+
     def remove_pr_reviewer(self, issue_number: int, username: str):
         from scripts.reviewer_bot_lib import github_api as github_api_module
 
         return github_api_module.remove_pr_reviewer(self._runtime_required(), issue_number, username)
 
+    def remove_pr_reviewers(self, issue_number: int, usernames: list[str]):
+        from scripts.reviewer_bot_lib import github_api as github_api_module
+
+        return github_api_module.remove_pr_reviewers(self._runtime_required(), issue_number, usernames)
+
     def get_user_permission_status(self, username: str, required_permission="triage"):
         from scripts.reviewer_bot_lib import github_api as github_api_module
 
@@ -142,8 +142,8 @@ def test_d4c_deletion_manifest_is_explicit_and_remaining_app_branches_stay_trans
     app_text = Path("scripts/reviewer_bot_lib/app.py").read_text(encoding="utf-8")
 
     assert D4C_DELETION_MANIFEST == []
-    assert 'if event_name == "issues":' in app_text
-    assert 'elif event_name == "pull_request_target":' in app_text
+    assert '("issues", "opened"): "handle_issue_or_pr_opened",' in app_text
+    assert '("pull_request_target", "synchronize"): "handle_pull_request_target_synchronize",' in app_text
     assert 'elif event_name == "workflow_run":' in app_text
     assert 'if state_changed or sync_changes or restored:' in app_text
     assert 'if touched_items:' in app_text
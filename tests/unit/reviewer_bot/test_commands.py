@@ -155,6 +155,24 @@ def test_assign_command_posts_pr_guidance_on_success(monkeypatch):
     assert posted == [guidance.get_pr_guidance("felix91gr", "PLeVasseur")]
 
 
+def test_assign_command_removes_previous_assignees_in_one_request(monkeypatch):
+    harness = CommandHarness(monkeypatch)
+    state = make_state()
+    state["queue"] = [{"github": "felix91gr", "name": "Félix Fischer"}]
+    harness.stub_assignees(["alice", "bob"])
+    harness.stub_assignment()
+    removals = []
+    remove_live_assignees = harness.runtime.github.remove_issue_assignees
+    harness.runtime.github.remove_issue_assignees = lambda issue_number, usernames: removals.append(list(usernames)) or remove_live_assignees(issue_number, usernames)
+    harness.runtime.github.post_comment = lambda issue_number, body: True
+
+    response, success = harness.handle_assign(state, 42, "@felix91gr")
+
+    assert success is True
+    assert response == "✅ @felix91gr has been assigned as reviewer (previously: @alice, @bob)."
+    assert removals == [["alice", "bob"]]
+
+
 def test_claim_command_posts_pr_guidance_on_success(monkeypatch):
     harness = CommandHarness(monkeypatch)
     state = make_state()
@@ -244,6 +262,22 @@ def test_pass_command_accepts_confirmed_pr_reviewer_when_live_reviewers_are_empt
     assert posted == [guidance.get_pr_guidance("bob", "dana")]
 
 
+def test_pass_command_rejects_actor_who_is_not_current_reviewer(monkeypatch):
+    harness = CommandHarness(monkeypatch)
+    state = make_state()
+    review = review_state.ensure_review_entry(state, 42, create=True)
+    assert review is not None
+    review["current_reviewer"] = "Alice"
+    request = harness.typed_assignment_request(issue_number=42, issue_author="dana", is_pull_request=False)
+    harness.stub_assignees(["alice"])
+
+    response, success = harness.handle_pass(state, 42, "bob", None, request=request)
+
+    assert success is False
+    assert response == "❌ Only the current reviewer (@Alice) can use `/pass`."
+    assert review["current_reviewer"] == "Alice"
+
+
 def test_release_command_accepts_confirmed_pr_reviewer_when_live_reviewers_are_empty(monkeypatch):
     harness = CommandHarness(monkeypatch)
     state = make_state()
@@ -423,7 +457,7 @@ def test_pass_command_does_not_mutate_reviewer_state_when_remove_fails(monkeypat
     review["current_reviewer"] = "alice"
     review["skipped"] = []
     harness.stub_assignees(["alice"])
-    harness.runtime.github.remove_issue_assignee = lambda issue_number, username: False
+    harness.runtime.github.remove_issue_assignees = lambda issue_number, usernames: False
 
     response, success = harness.handle_pass(state, 42, "alice", None)
 
@@ -460,7 +494,7 @@ def test_away_command_does_not_mutate_queue_when_reassignment_is_unconfirmed(mon
     assert review is not None
     review["current_reviewer"] = "alice"
     harness.stub_assignees(["alice"])
-    harness.runtime.github.remove_issue_assignee = lambda issue_number, username: False
+    harness.runtime.github.remove_issue_assignees = lambda issue_number, usernames: False
 
     response, success = harness.handle_pass_until(state, 42, "alice", "2099-01-01", None)
 
@@ -1189,7 +1223,11 @@ def test_manual_dispatch_marks_authorization_unavailable_for_pending_privileged_
         ("@guidelines-bot /r? @alice", ("r?-user", ["@alice"])),
         ("@guidelines-bot queue", ("_malformed_known", ["queue"])),
         ("@guidelines-bot /queue\n@guidelines-bot /pass", ("_multiple_commands", [])),
+        ("@guidelines-bot /queue @guidelines-bot /pass", ("_multiple_commands", [])),
+        ("@guidelines-bot /pass too busy\nthanks!", ("pass", ["too", "busy"])),
         ("@guidelines-bot hello", None),
+        ("@GUIDELINES-BOT /queue", ("queue", [])),
+        ("Thanks for the review! /queue", None),
     ],
 )
 def test_parse_command_preserves_known_command_classification(monkeypatch, comment_body, expected):
@@ -317,6 +317,17 @@ def test_remove_issue_assignee_calls_issue_assignees_delete(monkeypatch):
     assert [call.endpoint for call in github.request_calls] == ["issues/42/assignees"]
 
 
+def test_remove_issue_assignees_sends_all_usernames_in_one_delete(monkeypatch):
+    github = RouteGitHubApi()
+    github.add_request("DELETE", "issues/42/assignees", status_code=200, payload={})
+    bot = _bot(monkeypatch, github=github)
+
+    result = github_api.remove_issue_assignees(bot, 42, ["alice", "bob"])
+
+    assert result.success is True
+    assert [(call.endpoint, call.data) for call in github.request_calls] == [("issues/42/assignees", {"assignees": ["alice", "bob"]})]
+
+
 def test_find_open_pr_for_branch_status_reports_unavailable_for_malformed_payload(monkeypatch):
     bot = _bot(monkeypatch, github_api_request=lambda *args, **kwargs: GitHubApiResult(status_code=200, payload={"not": "a list"}, headers={}, text="ok", ok=True, failure_kind=None, retry_attempts=0, transport_error=None))
 
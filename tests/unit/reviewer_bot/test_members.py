@@ -51,3 +51,27 @@ def test_queue_sync_members_with_queue_uses_runtime_fetch_members(monkeypatch):
 
     assert updated["queue"] == [{"github": "alice", "name": "Alice Example"}]
     assert changes == ["Added alice to queue"]
+
+
+def test_queue_find_member_index_ignores_case():
+    members_list = [{"github": "Alice", "name": "Alice"}, {"github": "bob", "name": "Bob"}]
+
+    assert queue.find_member_index(members_list, "alice") == 0
+    assert queue.find_member_index(members_list, "BOB") == 1
+    assert queue.find_member_index(members_list, "carol") is None
+
+
+def test_queue_find_member_indices_reports_queue_and_away_positions():
+    state = {
+        "queue": [{"github": "alice", "name": "Alice"}],
+        "pass_until": [{"github": "Bob", "name": "Bob", "return_date": "2099-01-01"}],
+    }
+
+    assert queue.find_member_indices(state, "ALICE") == (0, None)
+    assert queue.find_member_indices(state, "bob") == (None, 0)
+    assert queue.find_member_indices(state, "carol") == (None, None)
+
+
+def test_queue_login_key_casefolds_and_drops_mention_prefix():
+    assert queue.login_key("@Alice") == queue.login_key("alice")
+    assert queue.find_member_index([{"github": "Straße", "name": "S"}], "STRASSE") == 0